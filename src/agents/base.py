@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 import logging
-from datetime import datetime
+from src.core.deadline import Deadline, DeadlineExceeded
+from src.utils.log_setup import get_logger
 
 class Agent(ABC):
     """
@@ -10,6 +11,7 @@ class Agent(ABC):
     Attributes:
         name (str): Name of the agent
         state (Dict): Current state of the agent
+        deadline (Deadline): Time budget for the current run
         logger (logging.Logger): Logger instance for the agent
     """
     
@@ -24,13 +26,12 @@ class Agent(ABC):
         self.name = name
         self.state = {}
         self.config = config or {}
+        self.deadline = Deadline()
         self.logger = self._setup_logger()
         
     def _setup_logger(self) -> logging.Logger:
-        """Set up logging for the agent."""
-        logger = logging.getLogger(f"agent.{self.name}")
-        logger.setLevel(logging.INFO)
-        return logger
+        """Set up logging for the agent. The level is inherited from the root logger."""
+        return get_logger(f"agent.{self.name}")
         
     @abstractmethod
     def perceive(self, input_data: Any) -> None:
@@ -40,7 +41,7 @@ class Agent(ABC):
         Args:
             input_data: Input data to be processed
         """
-        self.logger.info(f"Perceiving input data at {datetime.now()}")
+        self.logger.debug("Perceiving input data")
         
     @abstractmethod
     def decide(self) -> Any:
@@ -50,7 +51,7 @@ class Agent(ABC):
         Returns:
             Decision result based on the agent's logic
         """
-        self.logger.info(f"Making decision at {datetime.now()}")
+        self.logger.debug("Making decision")
         
     @abstractmethod
     def act(self) -> Any:
@@ -60,35 +61,52 @@ class Agent(ABC):
         Returns:
             Result of the action
         """
-        self.logger.info(f"Performing action at {datetime.now()}")
+        self.logger.debug("Performing action")
     
-    def run(self, input_data: Any) -> Any:
+    def run(self, input_data: Any, deadline: Optional[Deadline] = None) -> Any:
         """
         Execute the full perceive-decide-act cycle.
         
         Args:
             input_data: Input data to be processed
+            deadline (Deadline, optional): Time budget for this run
             
         Returns:
             Result of the action phase
         """
+        self.deadline = deadline or Deadline()
+        self.state['deadline_exceeded'] = False
         try:
-            self.logger.info(f"Starting agent cycle for {self.name}")
+            self.logger.info("Starting agent cycle for %s", self.name)
             self.perceive(input_data)
             decision = self.decide()
             self.state['last_decision'] = decision
             result = self.act()
             self.state['last_result'] = result
-            self.logger.info(f"Completed agent cycle for {self.name}")
+            self.logger.info("Completed agent cycle for %s", self.name)
             return result
         except Exception as e:
-            self.logger.error(f"Error in agent cycle: {str(e)}")
+            self.logger.error("Error in agent cycle: %s", e)
             raise
             
+    def partial(self, input_data: Any) -> Any:
+        """
+        Produce a degraded result when the deadline has passed before this
+        agent could run. Agents that can return something useful without
+        doing their full work should override this.
+        
+        Args:
+            input_data: Input data that would have been processed
+            
+        Returns:
+            Partial result for the agent
+        """
+        raise DeadlineExceeded(f"Deadline exceeded before {self.name} could run")
+            
     def reset(self) -> None:
         """Reset the agent's state."""
         self.state = {}
-        self.logger.info(f"Reset agent state for {self.name}")
+        self.logger.info("Reset agent state for %s", self.name)
         
     def get_state(self) -> Dict:
         """
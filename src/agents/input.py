@@ -16,7 +16,7 @@ class InputAgent(Agent):
         Args:
             input_data (str): The research topic
         """
-        self.logger.info(f"Received input topic: {input_data}")
+        self.logger.info("Received input topic: %s", input_data)
         if not isinstance(input_data, str):
             raise ValueError("Input must be a string")
         self.state['topic'] = input_data.strip()
@@ -36,7 +36,7 @@ class InputAgent(Agent):
         if len(topic) > self.max_length:
             raise ValueError(f"Topic too long. Maximum length is {self.max_length}")
             
-        self.logger.info(f"Topic '{topic}' validated successfully")
+        self.logger.info("Topic '%s' validated successfully", topic)
         return True
 
     def act(self) -> str:
@@ -47,4 +47,16 @@ class InputAgent(Agent):
             str: The validated topic
         """
         self.decide()  # Validate before returning
-        return self.state['topic']
\ No newline at end of file
+        return self.state['topic']
+
+    def partial(self, input_data: str) -> str:
+        """
+        Pass the topic through unvalidated when the deadline has passed.
+        
+        Args:
+            input_data (str): The research topic
+            
+        Returns:
+            str: The topic
+        """
+        return input_data
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 import requests
 from datetime import datetime, timedelta
 from .base import Agent
@@ -12,6 +12,7 @@ class RetrievalAgent(Agent):
         self.api_key = settings.NEWS_API_KEY
         self.base_url = "https://newsapi.org/v2/everything"
         self.max_articles = self.config.get('max_articles', 5)
+        self.request_timeout = self.config.get('request_timeout')
         
     def perceive(self, topic: str) -> None:
         """
@@ -21,14 +22,15 @@ class RetrievalAgent(Agent):
             topic (str): The research topic
         """
         self.state['topic'] = topic
-        self.logger.info(f"Preparing to retrieve articles for topic: {topic}")
+        self.logger.info("Preparing to retrieve articles for topic: %s", topic)
 
-    def decide(self) -> requests.Response:
+    def decide(self) -> Optional[requests.Response]:
         """
         Construct and execute the API request.
         
         Returns:
-            requests.Response: The API response
+            Optional[requests.Response]: The API response, or None if the
+            deadline expired before the request completed
         """
         # Calculate date range for last 7 days
         end_date = datetime.now()
@@ -44,14 +46,41 @@ class RetrievalAgent(Agent):
             'to': end_date.strftime('%Y-%m-%d')
         }
         
+        if self.deadline.expired():
+            return self._deadline_exceeded()
+            
         try:
-            response = requests.get(self.base_url, params=params)
+            response = requests.get(
+                self.base_url,
+                params=params,
+                timeout=self.deadline.timeout_for(self.request_timeout)
+            )
             response.raise_for_status()
             return response
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Error retrieving articles: {str(e)}")
+            if self.deadline.expired():
+                return self._deadline_exceeded()
+            self.logger.error("Error retrieving articles: %s", e)
             raise
 
+    def _deadline_exceeded(self) -> None:
+        """Record that the deadline expired before articles could be retrieved."""
+        self.logger.warning("Deadline exceeded, returning no articles")
+        self.state['deadline_exceeded'] = True
+        return None
+
+    def partial(self, topic: str) -> List[Dict[str, str]]:
+        """
+        Return no articles when the deadline has passed before retrieval.
+        
+        Args:
+            topic (str): The research topic
+            
+        Returns:
+            List[Dict[str, str]]: An empty list
+        """
+        return []
+
     def act(self) -> List[Dict[str, str]]:
         """
         Process the API response and return formatted articles.
@@ -59,7 +88,15 @@ class RetrievalAgent(Agent):
         Returns:
             List[Dict[str, str]]: List of processed articles
         """
-        response = self.decide()
+        # Reuse the decision from run() rather than requesting a second time,
+        # which would spend the remaining deadline budget again
+        if 'last_decision' in self.state:
+            response = self.state['last_decision']
+        else:
+            response = self.decide()
+        if response is None:
+            return self.partial(self.state['topic'])
+            
         articles = response.json().get('articles', [])
         
         processed_articles = []
@@ -73,5 +110,5 @@ class RetrievalAgent(Agent):
             }
             processed_articles.append(processed_article)
             
-        self.logger.info(f"Retrieved {len(processed_articles)} articles")
+        self.logger.info("Retrieved %d articles", len(processed_articles))
         return processed_articles
\ No newline at end of file
@@ -1,7 +1,11 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+from concurrent.futures import Future, FIRST_COMPLETED, wait
+import contextvars
+import threading
 from anthropic import Anthropic
 from .base import Agent
 from src.config.settings import settings
+from src.core.deadline import DeadlineExceeded
 
 class SummarizationAgent(Agent):
     """Agent for summarizing articles using Anthropic's API."""
@@ -11,6 +15,13 @@ class SummarizationAgent(Agent):
         self.client = Anthropic(api_key=settings.ANTHROPIC_API_KEY)
         self.model = self.config.get('model', 'claude-3-opus-20240229')
         self.max_tokens = self.config.get('max_tokens', 150)
+        self.request_timeout = self.config.get('request_timeout')
+        self.max_retries = self.config.get('max_retries', 2)
+        # Seconds to wait on a slow call before firing a duplicate (hedged) request
+        self.hedge_after = self.config.get('hedge_after')
+        if self.hedge_after is not None and self.request_timeout is None:
+            # Without a per-call timeout a losing request could run indefinitely
+            raise ValueError("request_timeout is required when hedge_after is set")
         
     def perceive(self, articles: List[Dict[str, str]]) -> None:
         """
@@ -20,7 +31,7 @@ class SummarizationAgent(Agent):
             articles (List[Dict[str, str]]): List of articles to summarize
         """
         self.state['articles'] = articles
-        self.logger.info(f"Preparing to summarize {len(articles)} articles")
+        self.logger.info("Preparing to summarize %d articles", len(articles))
 
     def _create_summary_prompt(self, article: Dict[str, str]) -> str:
         """
@@ -40,6 +51,135 @@ Content: {article['content']}
 
 Provide a clear, factual summary that captures the main points and key findings."""
 
+    def _create_message(self, prompt: str) -> str:
+        """
+        Call the Anthropic API for a single summary.
+        
+        Args:
+            prompt (str): Summary prompt
+            
+        Returns:
+            str: Summary text
+        """
+        client = self.client.with_options(**self._client_options())
+        response = client.messages.create(
+            model=self.model,
+            max_tokens=self.max_tokens,
+            temperature=0.5,
+            messages=[
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+        )
+        return response.content[0].text
+
+    def _client_options(self) -> Dict[str, Any]:
+        """
+        Work out the per-attempt timeout and SDK retry count for the next call.
+        Each SDK retry gets the full timeout again, so under a deadline only as
+        many retries are allowed as full attempts still fit in the budget.
+        
+        Returns:
+            Dict[str, Any]: Options for `Anthropic.with_options`
+        """
+        remaining = self.deadline.remaining()
+        if remaining is None:
+            options = {'max_retries': self.max_retries}
+            if self.request_timeout is not None:
+                options['timeout'] = self.request_timeout
+            return options
+            
+        if self.request_timeout is None:
+            # A single attempt may use whatever budget is left
+            return {'timeout': remaining, 'max_retries': 0}
+            
+        attempts = int(remaining // self.request_timeout)
+        return {
+            'timeout': min(self.request_timeout, remaining),
+            'max_retries': max(0, min(self.max_retries, attempts - 1))
+        }
+
+    def _submit(self, prompt: str) -> Future:
+        """
+        Start a summary request on its own daemon thread. A losing hedged
+        request cannot be aborted, so it must not hold up later requests.
+        
+        Args:
+            prompt (str): Summary prompt
+            
+        Returns:
+            Future: Future resolving to the summary text
+        """
+        future: Future = Future()
+        
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(self._create_message(prompt))
+            except Exception as e:
+                future.set_exception(e)
+                
+        # Carry the run's log correlation IDs into the request thread
+        context = contextvars.copy_context()
+        threading.Thread(target=context.run, args=(run,), daemon=True).start()
+        return future
+
+    def _summarize(self, prompt: str) -> str:
+        """
+        Summarize a prompt, hedging with a duplicate request if the first one
+        has not returned within `hedge_after` seconds. Whichever request
+        succeeds first wins.
+        
+        Args:
+            prompt (str): Summary prompt
+            
+        Returns:
+            str: Summary text
+        """
+        if self.hedge_after is None:
+            return self._create_message(prompt)
+            
+        pending = {self._submit(prompt)}
+        return self._wait_for_summary(prompt, pending)
+
+    def _wait_for_summary(self, prompt: str, pending: set) -> str:
+        """
+        Wait for the primary request, firing a hedge if it is slow, and return
+        the first successful summary. A losing request keeps running on its
+        own thread until it finishes or times out.
+        
+        Args:
+            prompt (str): Summary prompt
+            pending (set): Futures for requests in flight
+            
+        Returns:
+            str: Summary text
+        """
+        done, _ = wait(pending, timeout=self.deadline.timeout_for(self.hedge_after))
+        if not done and not self.deadline.expired():
+            self.logger.info("Hedging slow summary request after %ss", self.hedge_after)
+            pending.add(self._submit(prompt))
+            
+        error: Optional[Exception] = None
+        while True:
+            for future in done:
+                pending.discard(future)
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+            if not pending:
+                raise error
+            done, _ = wait(
+                pending,
+                timeout=self.deadline.remaining(),
+                return_when=FIRST_COMPLETED
+            )
+            if not done:
+                raise DeadlineExceeded("Deadline exceeded waiting for summary")
+
     def decide(self) -> List[Dict[str, Any]]:
         """
         Generate summaries for all articles.
@@ -48,34 +188,32 @@ Provide a clear, factual summary that captures the main points and key findings.
             List[Dict[str, Any]]: List of articles with summaries
         """
         summarized_articles = []
+        articles = self.state['articles']
         
-        for article in self.state['articles']:
+        for idx, article in enumerate(articles):
+            if self.deadline.expired():
+                summarized_articles.extend(self._deadline_exceeded(articles[idx:]))
+                break
+                
             try:
                 prompt = self._create_summary_prompt(article)
-                
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=self.max_tokens,
-                    temperature=0.5,
-                    messages=[
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ]
-                )
-                
-                summary = response.content[0].text
+                summary = self._summarize(prompt)
                 
                 summarized_article = {
                     **article,
                     'summary': summary
                 }
                 summarized_articles.append(summarized_article)
-                self.logger.info(f"Successfully summarized article: {article['title']}")
+                self.logger.debug(
+                    "Successfully summarized article: %s", article['title'], extra={'sample': True}
+                )
                 
             except Exception as e:
-                self.logger.error(f"Error summarizing article {article['title']}: {str(e)}")
+                if self.deadline.expired():
+                    summarized_articles.extend(self._deadline_exceeded(articles[idx:]))
+                    break
+                    
+                self.logger.error("Error summarizing article %s: %s", article['title'], e)
                 # Include the article but note the summarization failure
                 summarized_article = {
                     **article,
@@ -85,6 +223,35 @@ Provide a clear, factual summary that captures the main points and key findings.
                 
         return summarized_articles
 
+    def _deadline_exceeded(self, articles: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """Record that the deadline expired and return the unsummarized articles title-only."""
+        self.logger.warning("Deadline exceeded, returning %d articles without summaries", len(articles))
+        self.state['deadline_exceeded'] = True
+        return self.partial(articles)
+
+    def partial(self, articles: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Build title-only entries for articles that could not be summarized
+        before the deadline.
+        
+        Args:
+            articles (List[Dict[str, str]]): Articles left unsummarized
+            
+        Returns:
+            List[Dict[str, Any]]: Articles without content and an empty summary
+        """
+        return [
+            {
+                'title': article.get('title', ''),
+                'url': article.get('url', ''),
+                'source': article.get('source', 'Unknown'),
+                'published_at': article.get('published_at', ''),
+                'summary': '',
+                'partial': True
+            }
+            for article in articles
+        ]
+
     def act(self) -> List[Dict[str, Any]]:
         """
         Process and return the summarized articles.
@@ -92,6 +259,10 @@ Provide a clear, factual summary that captures the main points and key findings.
         Returns:
             List[Dict[str, Any]]: Processed articles with summaries
         """
-        summarized_articles = self.decide()
-        self.logger.info(f"Completed summarization of {len(summarized_articles)} articles")
+        # Reuse the decision from run() rather than summarizing a second time,
+        # which would spend the remaining deadline budget again
+        summarized_articles = self.state.get('last_decision')
+        if summarized_articles is None:
+            summarized_articles = self.decide()
+        self.logger.info("Completed summarization of %d articles", len(summarized_articles))
         return summarized_articles
\ No newline at end of file
@@ -1,16 +1,48 @@
 from pathlib import Path
+from typing import Optional
 import os
 import logging
 from dotenv import load_dotenv
-
-# Set up logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+from src.utils.log_setup import setup_logging
 
 # Load environment variables
 env_path = Path(__file__).parents[2] / '.env'
-logger.info(f"Looking for .env file at: {env_path}")
-load_dotenv(dotenv_path=env_path)
+env_loaded = load_dotenv(dotenv_path=env_path)
+
+# Validate logging options, falling back to defaults on bad values
+log_warnings = []
+
+log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
+if not isinstance(logging.getLevelName(log_level), int):
+    log_warnings.append(f"Unknown LOG_LEVEL '{log_level}', using INFO")
+    log_level = 'INFO'
+
+try:
+    log_sample_rate = float(os.getenv('LOG_SAMPLE_RATE', '1.0'))
+    if not 0.0 <= log_sample_rate <= 1.0:
+        raise ValueError
+except ValueError:
+    log_warnings.append(
+        f"Invalid LOG_SAMPLE_RATE '{os.getenv('LOG_SAMPLE_RATE')}', expected 0-1, using 1.0"
+    )
+    log_sample_rate = 1.0
+
+# Set up logging (LOG_FORMAT=json for structured output); skipped if the
+# application has already configured logging
+setup_logging(
+    level=log_level,
+    json_format=os.getenv('LOG_FORMAT', 'text').lower() == 'json',
+    use_queue=os.getenv('LOG_ASYNC', 'true').lower() != 'false',
+    sample_rate=log_sample_rate
+)
+logger = logging.getLogger(__name__)
+for warning in log_warnings:
+    logger.warning(warning)
+
+if env_loaded:
+    logger.info("Loaded .env file from: %s", env_path)
+else:
+    logger.info("No .env file found at: %s", env_path)
 
 class Settings:
     """Configuration settings loaded from environment variables."""
@@ -21,6 +53,9 @@ class Settings:
         self.ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
         self.NEWS_API_KEY = os.getenv('NEWS_API_KEY')
         
+        # Optional per-run deadline in seconds
+        self.WORKFLOW_TIMEOUT = self._parse_timeout(os.getenv('WORKFLOW_TIMEOUT'))
+        
         # Log status of each key (safely)
         if self.ANTHROPIC_API_KEY:
             logger.info("ANTHROPIC_API_KEY loaded successfully")
@@ -32,6 +67,22 @@ class Settings:
         else:
             logger.warning("NEWS_API_KEY not found")
     
+    @staticmethod
+    def _parse_timeout(value: Optional[str]) -> Optional[float]:
+        """Parse WORKFLOW_TIMEOUT, falling back to no deadline on bad values."""
+        if not value:
+            return None
+        try:
+            timeout = float(value)
+            if timeout <= 0:
+                raise ValueError
+        except ValueError:
+            logger.warning(
+                "Invalid WORKFLOW_TIMEOUT '%s', expected seconds > 0, running without a deadline", value
+            )
+            return None
+        return timeout
+    
     def validate(self) -> tuple[bool, list[str]]:
         """Validate the configuration settings."""
         errors = []
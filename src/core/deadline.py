@@ -0,0 +1,69 @@
+from typing import Optional
+import time
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a workflow run has used up its time budget."""
+
+
+class Deadline:
+    """
+    Time budget shared by a workflow run and every agent it executes.
+
+    Attributes:
+        timeout (float, optional): Total budget in seconds, None for unbounded
+        expires_at (float, optional): Monotonic clock time at which the budget runs out
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Start the clock on a new deadline.
+
+        Args:
+            timeout (float, optional): Budget in seconds; None means no deadline
+        """
+        self.timeout = timeout
+        self.expires_at = None if timeout is None else time.monotonic() + timeout
+
+    def remaining(self) -> Optional[float]:
+        """
+        Get the time left before the deadline.
+
+        Returns:
+            Optional[float]: Seconds remaining (never negative), or None if unbounded
+        """
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Check whether the deadline has passed."""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def timeout_for(self, cap: Optional[float] = None) -> Optional[float]:
+        """
+        Compute the timeout to use for a single external call.
+
+        Args:
+            cap (float, optional): Per-call upper bound in seconds
+
+        Returns:
+            Optional[float]: The smaller of the cap and the remaining budget,
+            or None if neither is set
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return cap
+        if cap is None:
+            return remaining
+        return min(cap, remaining)
+
+    def check(self) -> None:
+        """Raise DeadlineExceeded if the deadline has passed."""
+        if self.expired():
+            raise DeadlineExceeded(f"Deadline of {self.timeout}s exceeded")
+
+    def __str__(self) -> str:
+        """String representation of the deadline."""
+        return f"Deadline(timeout={self.timeout}, remaining={self.remaining()})"
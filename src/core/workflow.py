@@ -1,8 +1,10 @@
 from typing import List, Any, Optional, Dict
 import logging
-from datetime import datetime
 import asyncio
+import uuid
 from src.agents.base import Agent
+from src.core.deadline import Deadline, DeadlineExceeded
+from src.utils.log_setup import get_logger, log_context
 
 class Workflow:
     """
@@ -25,7 +27,8 @@ class Workflow:
         Args:
             agents (List[Agent]): List of agents to execute in sequence
             name (str): Name of the workflow
-            config (Dict, optional): Configuration for the workflow
+            config (Dict, optional): Configuration for the workflow.
+                'timeout' sets the default per-run deadline in seconds.
         """
         self.agents = agents
         self.name = name
@@ -34,64 +37,133 @@ class Workflow:
         self.logger = self._setup_logger()
         
     def _setup_logger(self) -> logging.Logger:
-        """Set up logging for the workflow."""
-        logger = logging.getLogger(f"workflow.{self.name}")
-        logger.setLevel(logging.INFO)
-        return logger
+        """Set up logging for the workflow. The level is inherited from the root logger."""
+        return get_logger(f"workflow.{self.name}")
         
-    def run(self, input_data: Any) -> Any:
+    def _log_context(self, input_data: Any):
+        """Tag every log record in this run with a fresh run ID and the topic."""
+        self.state['run_id'] = uuid.uuid4().hex[:12]
+        fields = {'run_id': self.state['run_id'], 'workflow': self.name}
+        if isinstance(input_data, str):
+            fields['topic'] = input_data
+        return log_context(**fields)
+        
+    def _create_deadline(self, timeout: Optional[float]) -> Deadline:
+        """Create the deadline for a run, falling back to the configured timeout."""
+        if timeout is None:
+            timeout = self.config.get('timeout')
+        return Deadline(timeout)
+        
+    def _run_partial(self, agent: Agent, current_data: Any, agent_state: Optional[Dict] = None) -> Any:
+        """
+        Ask an agent for a partial result once the deadline has passed.
+        
+        Args:
+            agent (Agent): Agent that was skipped or cut short
+            current_data: Input the agent would have processed
+            agent_state (Dict, optional): State of an agent cut short mid-run;
+                None if the agent was skipped entirely
+            
+        Returns:
+            Partial result from the agent
+        """
+        self.logger.warning("Deadline exceeded, requesting partial result from %s", agent.name)
+        self.state['deadline_exceeded'] = True
+        self.state[agent.name] = {**(agent_state or {}), 'deadline_exceeded': True}
+        return agent.partial(current_data)
+        
+    def _record_agent_state(self, agent: Agent) -> None:
+        """Store an agent's state, noting whether it degraded to a partial result."""
+        self.state[agent.name] = agent.get_state()
+        if self.state[agent.name].get('deadline_exceeded'):
+            self.state['deadline_exceeded'] = True
+        
+    def run(self, input_data: Any, timeout: Optional[float] = None) -> Any:
         """
         Execute the workflow sequentially.
         
         Args:
             input_data: Initial input data for the workflow
+            timeout (float, optional): Deadline for the run in seconds,
+                overriding the configured 'timeout'
             
         Returns:
-            Result from the final agent in the workflow
+            Result from the final agent in the workflow, or a partial result
+            if the deadline was exceeded
         """
-        try:
-            self.logger.info(f"Starting workflow execution at {datetime.now()}")
-            current_data = input_data
+        with self._log_context(input_data):
+            try:
+                self.logger.info("Starting workflow execution")
+                deadline = self._create_deadline(timeout)
+                self.state['deadline_exceeded'] = False
+                current_data = input_data
             
-            for agent in self.agents:
-                self.logger.info(f"Executing agent: {agent.name}")
-                current_data = agent.run(current_data)
-                self.state[agent.name] = agent.get_state()
+                for agent in self.agents:
+                    if deadline.expired():
+                        current_data = self._run_partial(agent, current_data)
+                        continue
+                    self.logger.info("Executing agent: %s", agent.name)
+                    try:
+                        current_data = agent.run(current_data, deadline=deadline)
+                    except DeadlineExceeded:
+                        current_data = self._run_partial(agent, current_data, agent.get_state())
+                        continue
+                    self._record_agent_state(agent)
                 
-            self.logger.info("Workflow completed successfully")
-            return current_data
+                self.logger.info("Workflow completed successfully")
+                return current_data
             
-        except Exception as e:
-            self.logger.error(f"Workflow failed: {str(e)}")
-            raise
+            except Exception as e:
+                self.logger.error("Workflow failed: %s", e)
+                raise
             
-    async def run_async(self, input_data: Any) -> Any:
+    async def run_async(self, input_data: Any, timeout: Optional[float] = None) -> Any:
         """
         Execute the workflow with support for async agents.
         
         Args:
             input_data: Initial input data for the workflow
+            timeout (float, optional): Deadline for the run in seconds,
+                overriding the configured 'timeout'
             
         Returns:
-            Result from the final agent in the workflow
+            Result from the final agent in the workflow, or a partial result
+            if the deadline was exceeded
         """
-        try:
-            self.logger.info(f"Starting async workflow execution at {datetime.now()}")
-            current_data = input_data
+        with self._log_context(input_data):
+            try:
+                self.logger.info("Starting async workflow execution")
+                deadline = self._create_deadline(timeout)
+                self.state['deadline_exceeded'] = False
+                current_data = input_data
             
-            for agent in self.agents:
-                if hasattr(agent, 'run_async'):
-                    current_data = await agent.run_async(current_data)
-                else:
-                    current_data = agent.run(current_data)
-                self.state[agent.name] = agent.get_state()
+                for agent in self.agents:
+                    if deadline.expired():
+                        current_data = self._run_partial(agent, current_data)
+                        continue
+                    if hasattr(agent, 'run_async'):
+                        try:
+                            current_data = await asyncio.wait_for(
+                                agent.run_async(current_data, deadline=deadline),
+                                timeout=deadline.remaining()
+                            )
+                        except (asyncio.TimeoutError, DeadlineExceeded):
+                            current_data = self._run_partial(agent, current_data, agent.get_state())
+                            continue
+                    else:
+                        try:
+                            current_data = agent.run(current_data, deadline=deadline)
+                        except DeadlineExceeded:
+                            current_data = self._run_partial(agent, current_data, agent.get_state())
+                            continue
+                    self._record_agent_state(agent)
                 
-            self.logger.info("Async workflow completed successfully")
-            return current_data
+                self.logger.info("Async workflow completed successfully")
+                return current_data
             
-        except Exception as e:
-            self.logger.error(f"Async workflow failed: {str(e)}")
-            raise
+            except Exception as e:
+                self.logger.error("Async workflow failed: %s", e)
+                raise
             
     def reset(self) -> None:
         """Reset the workflow and all agents to their initial state."""
@@ -11,11 +11,7 @@ from src.agents.summarization import SummarizationAgent
 from src.core.workflow import Workflow
 from src.config.settings import settings
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging is configured by src.config.settings
 logger = logging.getLogger(__name__)
 
 def setup_agents() -> Dict[str, Any]:
@@ -28,13 +24,16 @@ def setup_agents() -> Dict[str, Any]:
         ),
         'retrieval': RetrievalAgent(
             name="RetrievalAgent",
-            config={'max_articles': 5}
+            config={'max_articles': 5, 'request_timeout': 10}
         ),
         'summarization': SummarizationAgent(
             name="SummarizationAgent",
             config={
                 'model': 'claude-3-opus-20240229',
-                'max_tokens': 150
+                'max_tokens': 150,
+                'request_timeout': 30,
+                # Fire a backup request for summaries slower than this
+                'hedge_after': 10
             }
         )
     }
@@ -54,7 +53,7 @@ def save_results(topic: str, results: list) -> str:
     with filepath.open('w', encoding='utf-8') as f:
         json.dump(results, f, indent=2, ensure_ascii=False)
     
-    logger.info(f"Results saved to {filepath}")
+    logger.info("Results saved to %s", filepath)
     return str(filepath)
 
 def main():
@@ -65,7 +64,7 @@ def main():
             sys.exit(1)
             
         topic = ' '.join(sys.argv[1:])
-        logger.info(f"Starting research on topic: {topic}")
+        logger.info("Starting research on topic: %s", topic)
         print(f"\n🔍 Researching topic: {topic}")
         
         # Validate environment
@@ -76,7 +75,10 @@ def main():
             
         # Setup and run workflow
         agents = setup_agents()
-        workflow = Workflow(list(agents.values()))
+        workflow = Workflow(
+            list(agents.values()),
+            config={'timeout': settings.WORKFLOW_TIMEOUT}
+        )
         logger.info("Starting workflow execution")
         results = workflow.run(topic)
         
@@ -89,6 +91,9 @@ def main():
         print("\n📊 Summary:")
         print(f"Topic: {topic}")
         print(f"Articles processed: {len(results)}")
+        partial = sum(1 for article in results if article.get('partial'))
+        if partial:
+            print(f"⏱️ Deadline exceeded: {partial} articles returned without summaries")
         print("\n📑 Article Summaries:")
         for idx, article in enumerate(results, 1):
             print(f"\n{idx}. {article['title']}")
@@ -96,7 +101,7 @@ def main():
             print(f"Summary: {article['summary'][:200]}...")
             
     except Exception as e:
-        logger.error(f"Error in main: {str(e)}", exc_info=True)
+        logger.error("Error in main: %s", e, exc_info=True)
         print(f"\n❌ Error: {str(e)}")
         sys.exit(1)
 
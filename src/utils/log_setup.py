@@ -0,0 +1,193 @@
+from typing import Any, Dict, Iterator, Optional
+import atexit
+import contextvars
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import random
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - [%(run_id)s] %(message)s'
+
+# Correlation IDs attached to every record logged within a workflow run
+_log_context: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar(
+    'log_context', default={}
+)
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_handler: Optional[logging.Handler] = None
+
+
+@contextmanager
+def log_context(**fields: Any) -> Iterator[None]:
+    """
+    Attach correlation fields (e.g. run_id, topic) to all records logged
+    inside the block, including from nested agents.
+
+    Args:
+        **fields: Fields to add to each log record
+    """
+    token = _log_context.set({**_log_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+_base_record_factory = logging.getLogRecordFactory()
+
+
+def _record_factory(*args: Any, **kwargs: Any) -> logging.LogRecord:
+    """
+    Create log records carrying the current correlation fields, so they are
+    available to any handler, including ones configured by a host application.
+    """
+    record = _base_record_factory(*args, **kwargs)
+    record.context = _log_context.get()
+    record.run_id = record.context.get('run_id', '-')
+    return record
+
+
+logging.setLogRecordFactory(_record_factory)
+
+
+class SampleFilter(logging.Filter):
+    """
+    Keep only a fraction of records logged with `extra={'sample': True}`.
+
+    Attributes:
+        rate (float): Fraction of sampled records to keep, between 0 and 1
+    """
+
+    def __init__(self, rate: float = 1.0):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate >= 1.0 or not getattr(record, 'sample', False):
+            return True
+        return random.random() < self.rate
+
+
+# Shared by every agent and workflow logger; setup_logging sets its rate
+_sample_filter = SampleFilter()
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a logger that drops sampled records according to LOG_SAMPLE_RATE.
+    The filter sits on the logger rather than a handler, so sampling applies
+    whichever handlers the application has configured.
+
+    Args:
+        name (str): Logger name
+
+    Returns:
+        logging.Logger: The logger
+    """
+    logger = logging.getLogger(name)
+    if _sample_filter not in logger.filters:
+        logger.addFilter(_sample_filter)
+    return logger
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'timestamp': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            **getattr(record, 'context', {})
+        }
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _LazyQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that leaves formatting and I/O to the listener thread.
+
+    The stock QueueHandler runs the full formatter on the calling thread so the
+    record can be pickled. The queue here never leaves the process, so only the
+    message arguments are merged, capturing their values at the time of the call.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def setup_logging(level: str = 'INFO',
+                  json_format: bool = False,
+                  use_queue: bool = True,
+                  sample_rate: float = 1.0,
+                  force: bool = False) -> bool:
+    """
+    Configure the root logger. Like logging.basicConfig, this does not add a
+    handler if the application has already configured logging, unless `force`
+    is set. The sample rate applies either way. Safe to call more than once;
+    later calls replace the handler installed by earlier ones.
+
+    Args:
+        level (str): Root log level
+        json_format (bool): Emit structured JSON instead of plain text
+        use_queue (bool): Write records from a background thread via a queue
+        sample_rate (float): Fraction of sampled (per-article) records to keep
+        force (bool): Remove any existing root handlers first
+
+    Returns:
+        bool: True if a handler was installed
+    """
+    global _listener, _handler
+
+    _sample_filter.rate = sample_rate
+
+    root = logging.getLogger()
+    foreign_handlers = [h for h in root.handlers if h is not _handler]
+    if foreign_handlers:
+        if not force:
+            return False
+        for handler in foreign_handlers:
+            root.removeHandler(handler)
+            handler.close()
+
+    if _handler is not None:
+        root.removeHandler(_handler)
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(JsonFormatter() if json_format else logging.Formatter(TEXT_FORMAT))
+
+    if use_queue:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _handler = _LazyQueueHandler(log_queue)
+        _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+        _listener.start()
+    else:
+        _handler = stream_handler
+
+    root.addHandler(_handler)
+    root.setLevel(level)
+    return True
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the background listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
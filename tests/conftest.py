@@ -0,0 +1,48 @@
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+# Settings are loaded at import time; make sure the API clients can be constructed
+os.environ.setdefault('ANTHROPIC_API_KEY', 'test-key')
+os.environ.setdefault('NEWS_API_KEY', 'test-key')
+
+
+class FakeAnthropic:
+    """Stand-in for the Anthropic client that runs `create` for each call."""
+
+    def __init__(self, create):
+        self.create = create
+        self.options = []
+        self.messages = SimpleNamespace(create=self._create)
+
+    def with_options(self, **options):
+        self.options.append(options)
+        return self
+
+    def _create(self, **kwargs):
+        prompt = kwargs['messages'][0]['content']
+        return SimpleNamespace(content=[SimpleNamespace(text=self.create(prompt))])
+
+
+def slow(seconds, text='summary'):
+    """Build a `create` function that sleeps before returning `text`."""
+    def create(prompt):
+        time.sleep(seconds)
+        return text
+    return create
+
+
+@pytest.fixture
+def articles():
+    return [
+        {
+            'title': f'Article {i}',
+            'url': f'https://example.com/{i}',
+            'content': 'Content',
+            'source': 'Example',
+            'published_at': '2025-02-03'
+        }
+        for i in range(3)
+    ]
@@ -0,0 +1,138 @@
+import threading
+import time
+
+import pytest
+
+from src.agents.summarization import SummarizationAgent
+from src.core.deadline import Deadline
+from tests.conftest import FakeAnthropic, slow
+
+
+def make_agent(create, **config):
+    agent = SummarizationAgent("SummarizationAgent", config)
+    agent.client = FakeAnthropic(create)
+    return agent
+
+
+def test_summarizes_all_articles(articles):
+    agent = make_agent(slow(0))
+    results = agent.run(articles)
+    assert [a['summary'] for a in results] == ['summary'] * 3
+    assert not agent.get_state()['deadline_exceeded']
+
+
+def test_retries_kept_without_deadline(articles):
+    agent = make_agent(slow(0), request_timeout=5)
+    agent.run(articles[:1])
+    assert agent.client.options == [{'max_retries': 2, 'timeout': 5}]
+
+
+def test_retries_capped_by_remaining_budget(articles):
+    agent = make_agent(slow(0), request_timeout=5)
+
+    agent.run(articles[:1], deadline=Deadline(60))
+    assert agent.client.options[-1] == {'max_retries': 2, 'timeout': 5}
+
+    agent.run(articles[:1], deadline=Deadline(12))
+    assert agent.client.options[-1] == {'max_retries': 1, 'timeout': 5}
+
+    agent.run(articles[:1], deadline=Deadline(3))
+    options = agent.client.options[-1]
+    assert options['max_retries'] == 0 and options['timeout'] <= 3
+
+
+def test_bounded_deadline_without_request_timeout_uses_single_attempt(articles):
+    agent = make_agent(slow(0))
+    agent.run(articles[:1], deadline=Deadline(10))
+    options = agent.client.options[-1]
+    assert options['max_retries'] == 0 and 9 < options['timeout'] <= 10
+
+
+def test_hedge_wins_over_slow_primary(articles):
+    calls = []
+
+    def create(prompt):
+        calls.append(prompt)
+        if len(calls) == 1:
+            time.sleep(0.5)
+            return 'primary'
+        return 'hedge'
+
+    agent = make_agent(create, hedge_after=0.05, request_timeout=5)
+    start = time.monotonic()
+    results = agent.run(articles[:1])
+    assert time.monotonic() - start < 0.4
+    assert results[0]['summary'] == 'hedge'
+
+
+def test_hedge_used_when_primary_fails(articles):
+    calls = []
+
+    def create(prompt):
+        calls.append(prompt)
+        if len(calls) == 1:
+            time.sleep(0.1)
+            raise RuntimeError("primary failed")
+        time.sleep(0.2)
+        return 'hedge'
+
+    agent = make_agent(create, hedge_after=0.05, request_timeout=5)
+    assert agent.run(articles[:1])[0]['summary'] == 'hedge'
+
+
+def test_error_without_hedge_is_reported_in_summary(articles):
+    def create(prompt):
+        raise RuntimeError("boom")
+
+    agent = make_agent(create, hedge_after=1, request_timeout=5)
+    results = agent.run(articles[:1])
+    assert results[0]['summary'] == "Error generating summary: boom"
+
+
+def test_hedge_after_requires_request_timeout():
+    with pytest.raises(ValueError):
+        make_agent(slow(0), hedge_after=1)
+
+
+def test_losing_requests_do_not_delay_later_hedges(articles):
+    calls = []
+    lock = threading.Lock()
+
+    def create(prompt):
+        with lock:
+            calls.append(prompt)
+            primary = len(calls) % 2 == 1
+        if primary:
+            time.sleep(1.0)
+            return 'primary'
+        return 'hedge'
+
+    agent = make_agent(create, hedge_after=0.1, request_timeout=5)
+    start = time.monotonic()
+    results = agent.run(articles)
+    assert time.monotonic() - start < 0.6
+    assert [a['summary'] for a in results] == ['hedge'] * 3
+
+
+def test_deadline_mid_run_returns_title_only_entries(articles):
+    agent = make_agent(slow(0.15))
+    results = agent.run(articles, deadline=Deadline(0.1))
+
+    assert results[0]['summary'] == 'summary'
+    for article in results[1:]:
+        assert article['partial'] is True
+        assert article['summary'] == ''
+        assert article['title'].startswith('Article')
+        assert 'content' not in article
+    assert agent.get_state()['deadline_exceeded']
+
+
+def test_summaries_are_not_generated_twice(articles):
+    calls = []
+
+    def create(prompt):
+        calls.append(prompt)
+        return 'summary'
+
+    make_agent(create).run(articles)
+    assert len(calls) == len(articles)
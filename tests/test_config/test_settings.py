@@ -0,0 +1,16 @@
+import pytest
+
+from src.config.settings import Settings
+
+
+@pytest.mark.parametrize('value, expected', [
+    (None, None),
+    ('', None),
+    ('30', 30.0),
+    ('12.5', 12.5),
+    ('30s', None),
+    ('0', None),
+    ('-5', None),
+])
+def test_parse_workflow_timeout(value, expected):
+    assert Settings._parse_timeout(value) == expected
@@ -0,0 +1,137 @@
+import json
+import logging
+import random
+
+import pytest
+
+from src.agents.input import InputAgent
+from src.core.workflow import Workflow
+from src.utils import log_setup
+from src.utils.log_setup import (
+    JsonFormatter, SampleFilter, _LazyQueueHandler, get_logger, log_context, setup_logging
+)
+
+
+def make_record(msg='message', args=None, **extra):
+    factory = logging.getLogRecordFactory()
+    record = factory('agent.test', logging.INFO, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class ListHandler(logging.Handler):
+    """Handler standing in for one configured by a host application."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def root_logger():
+    """Restore the root logger's handlers and level after a test."""
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    yield root
+    log_setup._sample_filter.rate = 1.0
+    log_setup.shutdown_logging()
+    root.handlers = saved_handlers
+    root.setLevel(saved_level)
+    log_setup._handler = None
+
+
+def test_sample_filter_keeps_unsampled_records():
+    assert SampleFilter(0.0).filter(make_record())
+
+
+def test_sample_filter_rates():
+    sampled = make_record(sample=True)
+    assert SampleFilter(1.0).filter(sampled)
+    assert not SampleFilter(0.0).filter(sampled)
+
+    random.seed(0)
+    kept = sum(SampleFilter(0.25).filter(sampled) for _ in range(4000))
+    assert 800 < kept < 1200
+
+
+def test_log_context_nests_and_resets():
+    with log_context(run_id='abc', topic='AI'):
+        with log_context(topic='Health'):
+            assert make_record().context == {'run_id': 'abc', 'topic': 'Health'}
+        assert make_record().context == {'run_id': 'abc', 'topic': 'AI'}
+
+    record = make_record()
+    assert record.context == {}
+    assert record.run_id == '-'
+
+
+def test_json_formatter_fields():
+    with log_context(run_id='abc', topic='AI'):
+        record = make_record('Summarized %d articles', (3,))
+
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry['message'] == 'Summarized 3 articles'
+    assert entry['level'] == 'INFO'
+    assert entry['logger'] == 'agent.test'
+    assert entry['run_id'] == 'abc'
+    assert entry['topic'] == 'AI'
+    assert 'timestamp' in entry
+
+
+def test_queue_handler_captures_arguments_at_call_time():
+    state = {'n': 1}
+    record = _LazyQueueHandler(None).prepare(make_record('state %s', (state,)))
+    state['n'] = 2
+    assert record.getMessage() == "state {'n': 1}"
+
+
+def test_setup_logging_twice_does_not_stack_handlers(root_logger):
+    # pytest attaches its capture handlers during the test call, so clear them here
+    root_logger.handlers = []
+    assert setup_logging(level='DEBUG')
+    assert setup_logging(level='INFO', json_format=True)
+    assert len(root_logger.handlers) == 1
+    assert root_logger.level == logging.INFO
+
+
+def test_setup_logging_respects_existing_configuration(root_logger):
+    existing = logging.StreamHandler()
+    root_logger.handlers = [existing]
+
+    assert not setup_logging()
+    assert root_logger.handlers == [existing]
+
+    assert setup_logging(force=True)
+    assert existing not in root_logger.handlers
+    assert len(root_logger.handlers) == 1
+
+
+def test_foreign_handler_receives_run_context(root_logger):
+    handler = ListHandler()
+    root_logger.handlers = [handler]
+    root_logger.setLevel(logging.INFO)
+    assert not setup_logging()
+
+    workflow = Workflow([InputAgent("InputAgent")])
+    workflow.run("AI in Healthcare")
+
+    run_records = [r for r in handler.records if r.name.startswith(('agent.', 'workflow.'))]
+    assert run_records
+    for record in run_records:
+        assert record.run_id == workflow.state['run_id']
+        assert record.context['topic'] == "AI in Healthcare"
+
+
+def test_sampling_applies_under_foreign_handler(root_logger):
+    handler = ListHandler()
+    root_logger.handlers = [handler]
+    root_logger.setLevel(logging.DEBUG)
+    assert not setup_logging(sample_rate=0.0)
+
+    logger = get_logger('agent.sampled')
+    logger.debug("Per-article line", extra={'sample': True})
+    logger.info("Regular line")
+    assert [r.getMessage() for r in handler.records] == ["Regular line"]
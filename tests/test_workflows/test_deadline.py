@@ -0,0 +1,35 @@
+import time
+
+import pytest
+
+from src.core.deadline import Deadline, DeadlineExceeded
+
+
+def test_unbounded_deadline():
+    deadline = Deadline()
+    assert deadline.remaining() is None
+    assert not deadline.expired()
+    assert deadline.timeout_for() is None
+    assert deadline.timeout_for(5) == 5
+    deadline.check()
+
+
+def test_timeout_for_uses_smaller_of_cap_and_remaining():
+    deadline = Deadline(10)
+    assert deadline.timeout_for(2) == 2
+    assert 9 < deadline.timeout_for(30) <= 10
+    assert 9 < deadline.timeout_for() <= 10
+
+
+def test_expired_deadline():
+    deadline = Deadline(0.01)
+    time.sleep(0.02)
+    assert deadline.expired()
+    assert deadline.remaining() == 0
+    assert deadline.timeout_for(5) == 0
+    with pytest.raises(DeadlineExceeded):
+        deadline.check()
+
+
+def test_deadline_exceeded_is_timeout_error():
+    assert issubclass(DeadlineExceeded, TimeoutError)
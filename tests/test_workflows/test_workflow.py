@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from src.agents.input import InputAgent
+from src.agents.retrieval import RetrievalAgent
+from src.agents.summarization import SummarizationAgent
+from src.core.deadline import DeadlineExceeded
+from src.core.workflow import Workflow
+from tests.conftest import FakeAnthropic, slow
+
+
+class StaticRetrievalAgent(RetrievalAgent):
+    """Retrieval agent that returns fixed articles instead of calling the News API."""
+
+    def __init__(self, articles):
+        super().__init__("RetrievalAgent")
+        self.articles = articles
+
+    def decide(self):
+        return None
+
+    def act(self):
+        return self.articles
+
+
+class SlowAsyncAgent(InputAgent):
+    """Agent whose async run never finishes within the deadline."""
+
+    async def run_async(self, input_data, deadline=None):
+        await asyncio.sleep(1)
+        return input_data
+
+
+class DeadlineAgent(InputAgent):
+    """Agent that runs out of time part-way through its cycle."""
+
+    def decide(self):
+        self.state['started'] = True
+        raise DeadlineExceeded("out of time")
+
+
+class DeadlineAsyncAgent(InputAgent):
+    """Agent whose async run reports the deadline itself."""
+
+    async def run_async(self, input_data, deadline=None):
+        raise DeadlineExceeded("out of time")
+
+
+def make_workflow(articles, create, **config):
+    summarization = SummarizationAgent("SummarizationAgent")
+    summarization.client = FakeAnthropic(create)
+    agents = [InputAgent("InputAgent"), StaticRetrievalAgent(articles), summarization]
+    return Workflow(agents, config=config)
+
+
+def test_workflow_runs_all_agents(articles):
+    workflow = make_workflow(articles, slow(0))
+    results = workflow.run("AI in Healthcare")
+    assert [a['summary'] for a in results] == ['summary'] * 3
+    assert workflow.get_state()['agent_states']['deadline_exceeded'] is False
+
+
+def test_expired_deadline_returns_empty_result():
+    workflow = Workflow([InputAgent("InputAgent"), RetrievalAgent("RetrievalAgent")])
+    assert workflow.run("AI in Healthcare", timeout=0.0) == []
+    assert workflow.state['deadline_exceeded']
+
+
+def test_deadline_mid_summarization_flags_run(articles):
+    workflow = make_workflow(articles, slow(0.15), timeout=0.1)
+    results = workflow.run("AI in Healthcare")
+    assert any(a.get('partial') for a in results)
+    assert workflow.state['deadline_exceeded']
+
+    # The flag is cleared on the next run
+    results = workflow.run("AI in Healthcare", timeout=10)
+    assert not any(a.get('partial') for a in results)
+    assert not workflow.state['deadline_exceeded']
+
+
+@pytest.mark.asyncio
+async def test_run_async_falls_back_to_partial_on_timeout():
+    workflow = Workflow([SlowAsyncAgent("SlowAgent")])
+    result = await workflow.run_async("AI in Healthcare", timeout=0.05)
+    assert result == "AI in Healthcare"
+    assert workflow.state['deadline_exceeded']
+
+
+def test_agent_raising_deadline_exceeded_records_state():
+    workflow = Workflow([DeadlineAgent("DeadlineAgent")])
+    assert workflow.run("AI in Healthcare", timeout=10) == "AI in Healthcare"
+    agent_state = workflow.state['DeadlineAgent']
+    assert agent_state['deadline_exceeded'] is True
+    assert agent_state['started'] is True
+
+
+def test_skipped_agent_state_is_not_stale(articles):
+    workflow = make_workflow(articles, slow(0))
+    workflow.run("AI in Healthcare")
+    assert 'last_result' in workflow.state['SummarizationAgent']
+
+    workflow.run("AI in Healthcare", timeout=0.0)
+    assert workflow.state['SummarizationAgent'] == {'deadline_exceeded': True}
+
+
+@pytest.mark.asyncio
+async def test_run_async_handles_deadline_exceeded():
+    workflow = Workflow([DeadlineAsyncAgent("DeadlineAgent")])
+    assert await workflow.run_async("AI in Healthcare", timeout=10) == "AI in Healthcare"
+    assert workflow.state['DeadlineAgent']['deadline_exceeded'] is True